@@ -0,0 +1,130 @@
+/**
+ * Clientside rendering for the pure-presentation panels (alerts, patient
+ * communication, performance tiles). The server callbacks send one compact
+ * JSON blob per panel group; these functions rebuild the Div trees in the
+ * browser, avoiding a Python round-trip and hundreds of serialized
+ * component objects per click.
+ */
+
+function erEl(type, props) {
+    return {namespace: 'dash_html_components', type: type, props: props};
+}
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    er: {
+        renderAlerts: function (alerts) {
+            if (!alerts || alerts.length === 0) {
+                return erEl('Div', {children: [
+                    erEl('Div', {
+                        children: erEl('Span', {
+                            children: '✅ All departments operating within normal capacity',
+                            style: {color: 'white', fontWeight: 'bold'}
+                        }),
+                        style: {backgroundColor: '#27AE60', padding: '10px', borderRadius: '5px'}
+                    })
+                ]});
+            }
+            var components = alerts.map(function (alert) {
+                var color = alert.severity === 'HIGH' ? '#E74C3C' : '#F39C12';
+                return erEl('Div', {
+                    children: erEl('Span', {
+                        children: '⚠️ ' + (alert.message || 'Alert detected'),
+                        style: {color: 'white', fontWeight: 'bold'}
+                    }),
+                    style: {backgroundColor: color, padding: '10px', marginBottom: '5px', borderRadius: '5px'}
+                });
+            });
+            return erEl('Div', {children: components});
+        },
+
+        renderRoundInfo: function (state) {
+            if (!state) {
+                return null;
+            }
+            var m = state.metrics;
+            return erEl('Div', {children: [
+                erEl('Span', {children: 'Round ' + m.round + ' of 23',
+                              style: {fontWeight: 'bold', fontSize: '16px', color: '#2C3E50'}}),
+                erEl('Span', {children: ' | Total Patients in System: ' + m.total_in_system,
+                              style: {marginLeft: '20px', color: '#34495E'}})
+            ]});
+        },
+
+        renderStatusPanels: function (state) {
+            if (!state) {
+                return [null, null];
+            }
+
+            var commComponents = state.departments.map(function (dept) {
+                var estWait = dept.est_wait;
+                var waitColor, waitLabel;
+                if (estWait > 30) {
+                    waitColor = '#E74C3C';
+                    waitLabel = 'Long Wait';
+                } else if (estWait > 15) {
+                    waitColor = '#F39C12';
+                    waitLabel = 'Moderate Wait';
+                } else {
+                    waitColor = '#27AE60';
+                    waitLabel = 'Short Wait';
+                }
+
+                var smsMessage = '';
+                if (estWait > 20) {
+                    smsMessage = " SMS: 'Your estimated wait is " + Math.round(estWait) +
+                        " min. You may wait in cafe area. We'll text when ready.'";
+                }
+
+                return erEl('Div', {
+                    children: [
+                        erEl('Div', {children: [
+                            erEl('Span', {children: dept.name, style: {fontWeight: 'bold', fontSize: '13px'}}),
+                            erEl('Span', {children: ' - ' + dept.patients + ' patients',
+                                          style: {marginLeft: '10px', color: '#7F8C8D', fontSize: '12px'}})
+                        ]}),
+                        erEl('Div', {children: [
+                            erEl('Span', {children: ' Est. Wait: ', style: {fontSize: '12px'}}),
+                            erEl('Span', {children: Math.round(estWait) + ' min',
+                                          style: {fontSize: '12px', fontWeight: 'bold', color: waitColor}}),
+                            erEl('Span', {children: ' (' + waitLabel + ')',
+                                          style: {fontSize: '11px', color: waitColor, marginLeft: '5px'}})
+                        ]}),
+                        erEl('Div', {children: [
+                            erEl('Span', {children: ' ' + dept.staff + ' staff available',
+                                          style: {fontSize: '11px', color: '#34495E'}})
+                        ]}),
+                        smsMessage ? erEl('Div', {children: smsMessage,
+                            style: {fontSize: '10px', color: '#3498DB', marginTop: '3px', fontStyle: 'italic'}})
+                            : erEl('Div', {})
+                    ],
+                    style: {padding: '10px', marginBottom: '8px', backgroundColor: '#F8F9FA',
+                            borderLeft: '4px solid ' + dept.color, borderRadius: '3px'}
+                });
+            });
+
+            var m = state.metrics;
+            var tiles = [
+                {label: 'Avg Wait Time', value: m.avg_wait.toFixed(1) + ' min'},
+                {label: 'Total in System', value: m.total_in_system},
+                {label: 'Patients Treated', value: m.treated},
+                {label: 'Current Round', value: m.round + '/23'}
+            ];
+            var metricComponents = tiles.map(function (tile) {
+                return erEl('Div', {
+                    children: [
+                        erEl('Div', {children: '', style: {fontSize: '30px', marginBottom: '5px'}}),
+                        erEl('Div', {children: tile.value,
+                                     style: {fontSize: '24px', fontWeight: 'bold', color: '#2C3E50'}}),
+                        erEl('Div', {children: tile.label, style: {fontSize: '12px', color: '#7F8C8D'}})
+                    ],
+                    style: {textAlign: 'center', padding: '15px', backgroundColor: '#F8F9FA',
+                            borderRadius: '5px', width: '22%', display: 'inline-block',
+                            marginRight: '3%'}
+                });
+            });
+
+            return [erEl('Div', {children: commComponents}),
+                    erEl('Div', {children: metricComponents})];
+        }
+    }
+});
@@ -4,10 +4,16 @@ Real-time monitoring and predictive analytics dashboard
 FIXED VERSION - Resolved chunk loading errors
 """
 
+import json
+from functools import lru_cache
+
 import dash
-from dash import dcc, html, dash_table
-from dash.dependencies import Input, Output, State
+import flask
+from dash import dcc, html, dash_table, Patch
+from dash.dependencies import Input, Output, State, ClientsideFunction
+from dash.exceptions import PreventUpdate
 import plotly.graph_objs as go
+import plotly.io as pio
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -21,15 +27,71 @@ except ImportError:
     print("Warning: Custom modules not found. Using mock data.")
     CUSTOM_MODULES_AVAILABLE = False
 
+# Flask-Caching is optional - without it forecasts are recomputed per callback
+try:
+    from flask_caching import Cache
+    CACHING_AVAILABLE = True
+except ImportError:
+    print("Warning: flask_caching not found. Forecast memoization disabled.")
+    CACHING_AVAILABLE = False
+
+# joblib is optional - without it historical data is regenerated per restart
+try:
+    from joblib import Memory
+    JOBLIB_AVAILABLE = True
+except ImportError:
+    print("Warning: joblib not found. Historical data disk cache disabled.")
+    JOBLIB_AVAILABLE = False
+
+# flask_compress is optional - without it responses go out uncompressed
+try:
+    import flask_compress  # noqa: F401 - dash only needs it importable
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    print("Warning: flask_compress not found. HTTP compression disabled.")
+    COMPRESS_AVAILABLE = False
+
+# orjson is optional - without it callback responses use the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    print("Warning: orjson not found. Using stdlib JSON encoder.")
+    ORJSON_AVAILABLE = False
+
 # Initialize the Dash app with proper configuration
 app = dash.Dash(
-    __name__, 
+    __name__,
     suppress_callback_exceptions=True,
+    compress=COMPRESS_AVAILABLE,
     external_stylesheets=[
         'https://codepen.io/chriddyp/pen/bWLwgP.css'
     ]
 )
 
+# Callback responses (figure payloads, table rows) are serialized to JSON on
+# every request; orjson cuts that cost and serializes numpy arrays natively,
+# so vectorized results can go straight into traces without .tolist()
+if ORJSON_AVAILABLE:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonProvider(DefaultJSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.server.json = OrjsonProvider(app.server)
+
+# Component bundles under _dash-component-suites are versioned, so returning
+# visitors can cache them for good
+@app.server.after_request
+def add_static_cache_headers(response):
+    if '_dash-component-suites' in flask.request.path:
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
 # Department display names
 DEPT_NAMES = {
     'emergency_walkin': 'Emergency Walk-in',
@@ -39,7 +101,19 @@ DEPT_NAMES = {
     'step_down': 'Step Down'
 }
 
-# Capacity configuration (patients per staff member)
+# Department order shared by all vectorized per-department computations.
+# Hoisted once so the hot callbacks never rebuild key/item lists.
+DEPTS = tuple(DEPT_NAMES.keys())
+DEPT_ITEMS = tuple(DEPT_NAMES.items())
+DEPT_KEY_LIST = list(DEPTS)
+DEPT_LABELS = tuple(DEPT_NAMES.values())
+
+# Reverse lookup from display name back to department key (resource table
+# rows carry the display name)
+DEPT_KEY_BY_NAME = {v: k for k, v in DEPT_NAMES.items()}
+
+# Capacity configuration (patients per staff member and default bed counts;
+# per-session bed edits live in sim-state, this stays read-only)
 CAPACITY_CONFIG = {
     'emergency_walkin': {'patients_per_staff': 4, 'beds': 15},
     'emergency_ambulance': {'patients_per_staff': 3, 'beds': 10},
@@ -48,21 +122,56 @@ CAPACITY_CONFIG = {
     'step_down': {'patients_per_staff': 5, 'beds': 12}
 }
 
-# Simulation state
-simulation_state = {
-    'current_round': 1,
-    'current_patients': {dept: 0 for dept in DEPT_NAMES.keys()},
-    'wait_times': {dept: 0 for dept in DEPT_NAMES.keys()},
-    'total_treated': 0,
-    'staff_allocation': {
-        'emergency_walkin': {'staff': 5},
-        'emergency_ambulance': {'staff': 3},
-        'surgery': {'staff': 3},
-        'critical_care': {'staff': 3},
-        'step_down': {'staff': 3}
-    }
+# Default staffing used for fresh sessions and the reset button
+DEFAULT_STAFF_ALLOCATION = {
+    'emergency_walkin': {'staff': 5},
+    'emergency_ambulance': {'staff': 3},
+    'surgery': {'staff': 3},
+    'critical_care': {'staff': 3},
+    'step_down': {'staff': 3}
 }
 
+def build_initial_sim_state():
+    """Fresh per-session simulation state.
+
+    Held in a dcc.Store on the client rather than a module global, so server
+    processes stay stateless and multi-worker deployments see consistent state.
+    """
+    return {
+        'current_round': 1,
+        'current_patients': {dept: 0 for dept in DEPTS},
+        'wait_times': {dept: 0 for dept in DEPTS},
+        'total_treated': 0,
+        'staff_allocation': {dept: dict(cfg) for dept, cfg in DEFAULT_STAFF_ALLOCATION.items()},
+        'bed_capacity': {dept: CAPACITY_CONFIG[dept]['beds'] for dept in DEPTS}
+    }
+
+def resource_fingerprint(current_round, resource_data):
+    """Compact key over the round and the user-editable table columns.
+
+    Used to detect "Update Round" clicks that change nothing, so the main
+    callback can skip recomputing all of its outputs.
+    """
+    edits = [(row.get('department'), row.get('staff'), row.get('total_beds'))
+             for row in (resource_data or [])]
+    return f"{current_round}|{json.dumps(edits)}"
+
+def get_beds_array(bed_capacity):
+    """Bed capacities in DEPTS order from the per-session state"""
+    return np.fromiter((bed_capacity[dept] for dept in DEPTS),
+                       dtype=np.int32, count=len(DEPTS))
+
+@lru_cache(maxsize=512)
+def get_utilization_label(occupied, beds):
+    """Resource-table utilization label, cached on the small integer pairs
+    that actually occur so repeat callbacks skip the division and format"""
+    pct = occupied / beds * 100 if beds > 0 else 0.0
+    if pct >= 80:
+        return f"HIGH ({pct:.0f}%)"
+    if pct >= 60:
+        return f"MODERATE ({pct:.0f}%)"
+    return f"NORMAL ({pct:.0f}%)"
+
 # Color scheme for departments
 DEPT_COLORS = {
     'emergency_walkin': '#FF6B6B',
@@ -72,47 +181,273 @@ DEPT_COLORS = {
     'step_down': '#95E1D3'
 }
 
+# Historical data bootstrap. With joblib available the generated sessions
+# are pickled to .cache, so restarts (and each Gunicorn worker) load the
+# same data in milliseconds instead of re-running the generation pipeline.
+if JOBLIB_AVAILABLE:
+    _memory = Memory('.cache', verbose=0)
+
+    @_memory.cache
+    def _bootstrap_historical_data(num_sessions):
+        return ERDataGenerator().generate_multiple_sessions(num_sessions=num_sessions)
+else:
+    def _bootstrap_historical_data(num_sessions):
+        return ERDataGenerator().generate_multiple_sessions(num_sessions=num_sessions)
+
+if CUSTOM_MODULES_AVAILABLE:
+    class CachedAnalytics(ERPredictiveAnalytics):
+        """Analytics engine with per-round in-process memoization.
+
+        Historical data is frozen at startup, so forecasts are pure
+        functions of the round number. Each result is computed lazily on
+        first request and reused for the life of the worker process,
+        sitting in front of the disk-backed Flask-Caching layer below.
+        """
+
+        def __init__(self, historical_df):
+            super().__init__(historical_df)
+            self._fc_cache = {}
+            self._horizon_cache = {}
+
+        def forecast_all_departments(self, current_round):
+            if current_round not in self._fc_cache:
+                self._fc_cache[current_round] = super().forecast_all_departments(current_round)
+            return self._fc_cache[current_round]
+
+        def forecast_next_n_rounds(self, current_round, n=4):
+            key = (current_round, n)
+            if key not in self._horizon_cache:
+                self._horizon_cache[key] = super().forecast_next_n_rounds(current_round, n=n)
+            return self._horizon_cache[key]
+
 # Initialize data generators if available
 if CUSTOM_MODULES_AVAILABLE:
     try:
         generator = ERDataGenerator()
-        historical_data = generator.generate_multiple_sessions(num_sessions=5)
-        analytics = ERPredictiveAnalytics(historical_data)
+        historical_data = _bootstrap_historical_data(5)
+        analytics = CachedAnalytics(historical_data)
     except Exception as e:
         print(f"Error initializing modules: {e}")
         CUSTOM_MODULES_AVAILABLE = False
 
+# Historical data is immutable after startup, so aggregate it once here
+# instead of re-running the groupby on every callback
+if CUSTOM_MODULES_AVAILABLE:
+    HIST_SUMMARY = historical_data.groupby('round', sort=True)[DEPT_KEY_LIST].mean().reset_index()
+    HIST_X = HIST_SUMMARY['round'].to_numpy()
+    HIST_Y = {dept: HIST_SUMMARY[dept].to_numpy() for dept in DEPTS}
+else:
+    HIST_SUMMARY = None
+    HIST_X = None
+    HIST_Y = None
+
+# Server-side cache for forecast results
+# Forecasts are pure functions of the round number (historical data is frozen
+# at startup), so repeat clicks on the same round become cache lookups instead
+# of full forecast regeneration
+if CACHING_AVAILABLE:
+    cache = Cache(app.server, config={
+        'CACHE_TYPE': 'FileSystemCache',
+        'CACHE_DIR': '/tmp/dash-cache'
+    })
+
+    @cache.memoize(timeout=300)
+    def get_cached_forecasts(current_round):
+        """Memoized wrapper around analytics.forecast_all_departments"""
+        return analytics.forecast_all_departments(current_round)
+
+    @cache.memoize(timeout=300)
+    def get_cached_forecast_horizon(current_round, n=4):
+        """Memoized wrapper around analytics.forecast_next_n_rounds"""
+        return analytics.forecast_next_n_rounds(current_round, n=n)
+
+    @cache.memoize(timeout=300)
+    def get_cached_surge_alerts(current_round, threshold_percentile=75):
+        """Memoized surge detection for a given round"""
+        forecasts = get_cached_forecasts(current_round)
+        return analytics.detect_surge(forecasts, threshold_percentile=threshold_percentile)
+else:
+    # Fallbacks without caching - call the analytics engine directly
+    def get_cached_forecasts(current_round):
+        return analytics.forecast_all_departments(current_round)
+
+    def get_cached_forecast_horizon(current_round, n=4):
+        return analytics.forecast_next_n_rounds(current_round, n=n)
+
+    def get_cached_surge_alerts(current_round, threshold_percentile=75):
+        forecasts = get_cached_forecasts(current_round)
+        return analytics.detect_surge(forecasts, threshold_percentile=threshold_percentile)
+
 # Mock data functions for when custom modules aren't available
+# Mean arrivals per department, in DEPTS order
+MOCK_ARRIVAL_RATES = np.array([2, 1, 1, 1, 1], dtype=np.float64)
+
 def generate_mock_arrivals(round_num):
     """Generate mock patient arrivals"""
-    base_arrivals = {
-        'emergency_walkin': np.random.poisson(2),
-        'emergency_ambulance': np.random.poisson(1),
-        'surgery': np.random.poisson(1),
-        'critical_care': np.random.poisson(1),
-        'step_down': np.random.poisson(1)
-    }
-    return base_arrivals
+    draws = np.random.poisson(MOCK_ARRIVAL_RATES)
+    return dict(zip(DEPTS, draws.tolist()))
 
 def generate_mock_forecast(current_round, n=4):
     """Generate mock forecast data"""
-    forecasts = {}
-    for i in range(current_round, current_round + n):
-        forecasts[i] = {}
-        for dept in DEPT_NAMES.keys():
-            forecasts[i][dept] = {
-                'forecast': np.random.poisson(5),
-                'confidence': 0.85
-            }
-    return forecasts
+    # One batched Poisson draw for every (round, dept) cell instead of n*5
+    # scalar sampler calls
+    draws = np.random.poisson(5, size=(n, len(DEPTS)))
+    return {
+        current_round + i: {
+            dept: {'forecast': int(draws[i, j]), 'confidence': 0.85}
+            for j, dept in enumerate(DEPTS)
+        }
+        for i in range(n)
+    }
 
 def generate_mock_historical():
     """Generate mock historical data"""
-    rounds = list(range(1, 24))
-    data = {'round': rounds}
-    for dept in DEPT_NAMES.keys():
-        data[dept] = [np.random.poisson(3) for _ in rounds]
-    return pd.DataFrame(data)
+    arr = np.random.poisson(3, size=(23, len(DEPTS)))
+    df = pd.DataFrame(arr, columns=DEPT_KEY_LIST)
+    df.insert(0, 'round', np.arange(1, 24))
+    return df
+
+# Shared layout template for the line charts, registered once so each
+# figure build passes a single template reference through plotly's layout
+# validators instead of re-validating the same margin/legend dicts
+pio.templates['er'] = go.layout.Template(layout=dict(
+    height=300,
+    margin=dict(l=40, r=20, t=20, b=40),
+    hovermode='x unified',
+    legend=dict(orientation='h', yanchor='bottom', y=1.02, xanchor='right', x=1)
+))
+
+# Static figure shells - built once at import. Callbacks return Patch()
+# objects that update only the changed arrays (heatmap z-values, forecast
+# y-values, current-round marker) instead of re-serializing whole figures.
+def build_initial_heatmap():
+    """Heatmap shell with fixed labels/colorscale; z-values get patched"""
+    fig = go.Figure(data=go.Heatmap(
+        z=[[0.0] * len(DEPTS)],
+        x=list(DEPT_LABELS),
+        y=['Capacity Utilization'],
+        zmin=0, zmax=100,
+        colorscale=[[0, '#27AE60'], [0.5, '#F39C12'], [1, '#E74C3C']],
+        zsmooth='fast',
+        hovertemplate='%{x}: %{z:.0f}%<extra></extra>',
+        colorbar=dict(title="Utilization %")
+    ))
+    fig.update_layout(
+        height=200,
+        margin=dict(l=20, r=20, t=20, b=20),
+        xaxis=dict(tickangle=-45)
+    )
+    return fig
+
+def build_initial_forecast_figure():
+    """Forecast shell with one empty trace per department"""
+    # Traces go in as one batched dict list: a single validation pass at
+    # Figure construction instead of per-trace validation in add_trace
+    traces = [
+        dict(type='scattergl',
+             x=[], y=[],
+             name=dept_name,
+             mode='lines+markers',
+             line=dict(color=DEPT_COLORS[dept], width=3),
+             marker=dict(size=8))
+        for dept, dept_name in DEPT_ITEMS
+    ]
+    return go.Figure({
+        'data': traces,
+        'layout': dict(
+            template='er',
+            xaxis_title="Round",
+            yaxis_title="Expected Patients"
+        )
+    })
+
+# Cap on points per historical trace. More points than this carry no visual
+# information at panel width, so longer histories are decimated before the
+# figure is serialized (same rationale as plotly-resampler, without the
+# dependency - the current 23-round data passes through untouched)
+HIST_MAX_POINTS = 500
+
+def downsample_trace(x, y, max_points=HIST_MAX_POINTS):
+    """Stride-decimate a trace to at most max_points, keeping the last point"""
+    if len(x) <= max_points:
+        return x, y
+    idx = np.linspace(0, len(x) - 1, max_points).astype(np.intp)
+    return x[idx], y[idx]
+
+def build_initial_historical_figure():
+    """Historical trends with static traces; only the round marker moves"""
+    if CUSTOM_MODULES_AVAILABLE:
+        hist_x = HIST_X
+        hist_y = HIST_Y
+    else:
+        mock_summary = generate_mock_historical()
+        hist_x = mock_summary['round'].to_numpy()
+        hist_y = {dept: mock_summary[dept].to_numpy() for dept in DEPTS}
+
+    hist_y = {dept: downsample_trace(hist_x, hist_y[dept])[1] for dept in DEPTS}
+    hist_x = downsample_trace(hist_x, hist_x)[0]
+
+    traces = [
+        dict(type='scattergl',
+             x=hist_x,
+             y=hist_y[dept],
+             name=dept_name,
+             mode='lines',
+             line=dict(color=DEPT_COLORS[dept], width=2),
+             opacity=0.7)
+        for dept, dept_name in DEPT_ITEMS
+    ]
+    fig = go.Figure({
+        'data': traces,
+        'layout': dict(
+            template='er',
+            # Rendered with staticPlot, so skip the unified-hover machinery
+            hovermode=False,
+            xaxis_title="Round",
+            yaxis_title="Average Patients"
+        )
+    })
+    fig.add_vline(x=1, line_dash="dash", line_color="red",
+                  annotation_text="Current Round")
+    return fig
+
+# Conditional styles for the resource table, built once. The color rules
+# compare the numeric utilization_pct data field instead of substring-matching
+# the formatted label
+STYLE_DATA_COND = [
+    {
+        'if': {'column_id': 'department'},
+        'fontWeight': 'bold',
+        'backgroundColor': '#F8F9FA'
+    },
+    {
+        'if': {
+            'filter_query': '{utilization_pct} >= 80',
+            'column_id': 'utilization'
+        },
+        'backgroundColor': '#E74C3C',
+        'color': 'white',
+        'fontWeight': 'bold'
+    },
+    {
+        'if': {
+            'filter_query': '{utilization_pct} >= 60 && {utilization_pct} < 80',
+            'column_id': 'utilization'
+        },
+        'backgroundColor': '#F39C12',
+        'color': 'white',
+        'fontWeight': 'bold'
+    },
+    {
+        'if': {
+            'filter_query': '{utilization_pct} < 60',
+            'column_id': 'utilization'
+        },
+        'backgroundColor': '#27AE60',
+        'color': 'white',
+        'fontWeight': 'bold'
+    }
+]
 
 # Define the layout
 app.layout = html.Div([
@@ -124,6 +459,21 @@ app.layout = html.Div([
                style={'textAlign': 'center', 'color': '#7F8C8D', 'fontSize': '18px'})
     ], style={'backgroundColor': '#ECF0F1', 'padding': '20px', 'marginBottom': '20px'}),
     
+    # Current round shared by the downstream (forecast/historical) callbacks;
+    # only updated when the round actually changes so those panels can skip
+    # recomputation on pure resource edits
+    # Per-session simulation state (see build_initial_sim_state)
+    dcc.Store(id='sim-state', storage_type='session', data=build_initial_sim_state()),
+
+    dcc.Store(id='round-store', data=1),
+
+    # Compact state blobs rendered clientside (see assets/er.js)
+    dcc.Store(id='er-state-store'),
+    dcc.Store(id='alerts-store'),
+    # Fingerprint of the last (round, resource table) pair, used to skip
+    # no-op "Update Round" clicks entirely
+    dcc.Store(id='last-input-store'),
+
     # Control Panel
     html.Div([
         html.Div([
@@ -154,7 +504,10 @@ app.layout = html.Div([
             html.Div([
                 html.H3(" Department Status Heat Map", 
                        style={'color': '#2C3E50', 'marginBottom': '15px'}),
-                dcc.Graph(id='heatmap-chart')
+                # Hover stays on: since chunk0-8 it is the only place the
+                # utilization percentages are shown. Only the modebar goes
+                dcc.Graph(id='heatmap-chart', figure=build_initial_heatmap(),
+                          config={'displayModeBar': False})
             ], style={'backgroundColor': 'white', 'padding': '20px', 'marginBottom': '20px',
                      'borderRadius': '10px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'}),
             
@@ -202,40 +555,7 @@ app.layout = html.Div([
                         'textAlign': 'center',
                         'border': '1px solid #2980B9'
                     },
-                    style_data_conditional=[
-                        {
-                            'if': {'column_id': 'department'},
-                            'fontWeight': 'bold',
-                            'backgroundColor': '#F8F9FA'
-                        },
-                        {
-                            'if': {
-                                'filter_query': '{utilization} contains "HIGH"',
-                                'column_id': 'utilization'
-                            },
-                            'backgroundColor': '#E74C3C',
-                            'color': 'white',
-                            'fontWeight': 'bold'
-                        },
-                        {
-                            'if': {
-                                'filter_query': '{utilization} contains "MODERATE"',
-                                'column_id': 'utilization'
-                            },
-                            'backgroundColor': '#F39C12',
-                            'color': 'white',
-                            'fontWeight': 'bold'
-                        },
-                        {
-                            'if': {
-                                'filter_query': '{utilization} contains "NORMAL"',
-                                'column_id': 'utilization'
-                            },
-                            'backgroundColor': '#27AE60',
-                            'color': 'white',
-                            'fontWeight': 'bold'
-                        }
-                    ],
+                    style_data_conditional=STYLE_DATA_COND,
                     style_cell_conditional=[
                         {'if': {'column_id': 'department'}, 'width': '20%'},
                         {'if': {'column_id': 'utilization'}, 'textAlign': 'center'},
@@ -271,7 +591,7 @@ app.layout = html.Div([
             html.Div([
                 html.H3(" Predictive Forecast (Next 4 Rounds)", 
                        style={'color': '#2C3E50', 'marginBottom': '15px'}),
-                dcc.Graph(id='forecast-chart')
+                dcc.Graph(id='forecast-chart', figure=build_initial_forecast_figure())
             ], style={'backgroundColor': 'white', 'padding': '20px', 'marginBottom': '20px',
                      'borderRadius': '10px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'}),
             
@@ -287,7 +607,8 @@ app.layout = html.Div([
             html.Div([
                 html.H3(" Historical Arrival Patterns", 
                        style={'color': '#2C3E50', 'marginBottom': '15px'}),
-                dcc.Graph(id='historical-trends')
+                dcc.Graph(id='historical-trends', figure=build_initial_historical_figure(),
+                          config={'staticPlot': True, 'displayModeBar': False})
             ], style={'backgroundColor': 'white', 'padding': '20px',
                      'borderRadius': '10px', 'boxShadow': '0 2px 4px rgba(0,0,0,0.1)'}),
         ], style={'width': '48%', 'display': 'inline-block', 'verticalAlign': 'top',
@@ -302,51 +623,93 @@ app.layout = html.Div([
 ], style={'padding': '20px', 'backgroundColor': '#F5F6FA', 'fontFamily': 'Arial, sans-serif'})
 
 
-# Main callback
+def get_forecast_horizon(current_round):
+    """Fetch the 4-round forecast horizon, falling back to mock data"""
+    if CUSTOM_MODULES_AVAILABLE:
+        try:
+            return get_cached_forecast_horizon(current_round, n=4)
+        except:
+            return generate_mock_forecast(current_round)
+    return generate_mock_forecast(current_round)
+
+
+# First-load outputs are a pure function of the default state, so they are
+# computed once per worker and replayed for every new session's initial fire
+_initial_outputs = None
+
+# Simulation-state callback: handles button clicks, mutates state, and
+# renders the panels that depend on patient counts / staffing. Publishes
+# the current round to round-store so the forecast and historical callbacks
+# only fire when the round actually changes.
 @app.callback(
-    [Output('round-info', 'children'),
-     Output('alert-panel', 'children'),
-     Output('heatmap-chart', 'figure'),
-     Output('patient-communication', 'children'),
+    [Output('heatmap-chart', 'figure'),
+     Output('er-state-store', 'data'),
      Output('resource-table', 'data'),
-     Output('performance-metrics', 'children'),
-     Output('forecast-chart', 'figure'),
      Output('staffing-recommendations', 'children'),
-     Output('historical-trends', 'figure')],
+     Output('round-store', 'data'),
+     Output('sim-state', 'data'),
+     Output('last-input-store', 'data')],
     [Input('update-round-btn', 'n_clicks'),
      Input('simulate-btn', 'n_clicks'),
      Input('reset-resources-btn', 'n_clicks')],
     [State('current-round-input', 'value'),
-     State('resource-table', 'data')]
+     State('resource-table', 'data'),
+     State('round-store', 'data'),
+     State('sim-state', 'data'),
+     State('last-input-store', 'data')]
 )
-def update_dashboard(update_clicks, simulate_clicks, reset_clicks, current_round, resource_data):
-    """Main callback to update all dashboard components"""
-    
+def update_simulation(update_clicks, simulate_clicks, reset_clicks, current_round, resource_data, stored_round, sim_state, last_input_key):
+    """Update simulation state and the status panels"""
+    global _initial_outputs
+
+    # First call of a fresh session may arrive before the Store is populated;
+    # sessions stored before beds moved into the state get the defaults
+    if not sim_state:
+        sim_state = build_initial_sim_state()
+    sim_state.setdefault('bed_capacity',
+                         {dept: CAPACITY_CONFIG[dept]['beds'] for dept in DEPTS})
+
     # Determine which button was clicked
     ctx = dash.callback_context
     if not ctx.triggered:
         button_id = 'update-round-btn'
     else:
         button_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    
+
+    # The initial no-trigger fire of a fresh session is deterministic (no
+    # arrivals are simulated), so replay the outputs computed for the first
+    # such session instead of redoing the work on every page load
+    cache_first_load = (not ctx.triggered and current_round == 1
+                        and sim_state == build_initial_sim_state())
+    if cache_first_load and _initial_outputs is not None:
+        return _initial_outputs
+
+    # Re-clicking "Update Round" with the same round and untouched resource
+    # table would recompute every output just to reproduce what's already
+    # on screen - skip the whole callback instead
+    if (ctx.triggered and button_id == 'update-round-btn'
+            and resource_fingerprint(current_round, resource_data) == last_input_key):
+        raise PreventUpdate
+
     # If reset button clicked, restore defaults
     if button_id == 'reset-resources-btn':
-        simulation_state['staff_allocation'] = {
-            'emergency_walkin': {'staff': 5},
-            'emergency_ambulance': {'staff': 3},
-            'surgery': {'staff': 3},
-            'critical_care': {'staff': 3},
-            'step_down': {'staff': 3}
+        sim_state['staff_allocation'] = {
+            dept: dict(cfg) for dept, cfg in DEFAULT_STAFF_ALLOCATION.items()
         }
-    
-    # Update staff allocation from table if data exists
+        sim_state['bed_capacity'] = {
+            dept: CAPACITY_CONFIG[dept]['beds'] for dept in DEPTS
+        }
+
+    # Update staff and bed allocation from table if data exists - all edits
+    # land in the per-session state, never in the module-level config
     if resource_data and button_id != 'reset-resources-btn':
         for row in resource_data:
             dept_name = row['department']
-            dept_key = next((k for k, v in DEPT_NAMES.items() if v == dept_name), None)
+            dept_key = DEPT_KEY_BY_NAME.get(dept_name)
             if dept_key:
-                simulation_state['staff_allocation'][dept_key]['staff'] = int(row.get('staff', 3))
-                CAPACITY_CONFIG[dept_key]['beds'] = int(row.get('total_beds', CAPACITY_CONFIG[dept_key]['beds']))
+                sim_state['staff_allocation'][dept_key]['staff'] = int(row.get('staff', 3))
+                sim_state['bed_capacity'][dept_key] = int(
+                    row.get('total_beds', sim_state['bed_capacity'][dept_key]))
     
     # If simulate button, increment round
     if button_id == 'simulate-btn' and simulate_clicks > 0:
@@ -361,306 +724,228 @@ def update_dashboard(update_clicks, simulate_clicks, reset_clicks, current_round
         else:
             new_arrivals = generate_mock_arrivals(current_round)
             
-        for dept in DEPT_NAMES.keys():
-            simulation_state['current_patients'][dept] += new_arrivals[dept]
-    
-    simulation_state['current_round'] = current_round
+        for dept in DEPTS:
+            sim_state['current_patients'][dept] += new_arrivals[dept]
     
-    # Get forecasts and analytics
-    if CUSTOM_MODULES_AVAILABLE:
-        try:
-            forecasts = analytics.forecast_all_departments(current_round)
-            future_forecasts = analytics.forecast_next_n_rounds(current_round, n=4)
-            alerts = analytics.detect_surge(forecasts, threshold_percentile=75)
-        except:
-            future_forecasts = generate_mock_forecast(current_round)
-            alerts = []
-    else:
-        future_forecasts = generate_mock_forecast(current_round)
-        alerts = []
-    
-    # 1. Round Info
-    round_info = html.Div([
-        html.Span(f"Round {current_round} of 23", 
-                 style={'fontWeight': 'bold', 'fontSize': '16px', 'color': '#2C3E50'}),
-        html.Span(f" | Total Patients in System: {sum(simulation_state['current_patients'].values())}",
-                 style={'marginLeft': '20px', 'color': '#34495E'})
-    ])
-    
-    # 2. Alert Panel
-    alert_components = []
-    if alerts:
-        for alert in alerts:
-            color = '#E74C3C' if alert.get('severity') == 'HIGH' else '#F39C12'
-            alert_components.append(
-                html.Div([
-                    html.Span(f"⚠️ {alert.get('message', 'Alert detected')}", 
-                             style={'color': 'white', 'fontWeight': 'bold'})
-                ], style={'backgroundColor': color, 'padding': '10px', 'marginBottom': '5px',
-                         'borderRadius': '5px'})
-            )
-    else:
-        alert_components.append(
-            html.Div([
-                html.Span("✅ All departments operating within normal capacity", 
-                         style={'color': 'white', 'fontWeight': 'bold'})
-            ], style={'backgroundColor': '#27AE60', 'padding': '10px',
-                     'borderRadius': '5px'})
-        )
-    
-    alert_panel = html.Div(alert_components)
-    
-    # 3. Heat Map
-    heatmap_data = []
-    for dept in DEPT_NAMES.keys():
-        current = simulation_state['current_patients'][dept]
-        capacity = CAPACITY_CONFIG[dept]['beds']
-        utilization = (current / capacity) * 100 if capacity > 0 else 0
-        heatmap_data.append({
-            'Department': DEPT_NAMES[dept],
-            'Utilization %': utilization
-        })
-    
-    heatmap_df = pd.DataFrame(heatmap_data)
-    
-    heatmap_fig = go.Figure(data=go.Heatmap(
-        z=[heatmap_df['Utilization %'].values],
-        x=heatmap_df['Department'].values,
-        y=['Capacity Utilization'],
-        colorscale=[[0, '#27AE60'], [0.5, '#F39C12'], [1, '#E74C3C']],
-        text=[[f"{val:.0f}%" for val in heatmap_df['Utilization %'].values]],
-        texttemplate='%{text}',
-        textfont={"size": 14},
-        colorbar=dict(title="Utilization %")
-    ))
-    
-    heatmap_fig.update_layout(
-        height=200,
-        margin=dict(l=20, r=20, t=20, b=20),
-        xaxis=dict(tickangle=-45)
+    sim_state['current_round'] = current_round
+
+    # Forecast horizon for the staffing panel (cache hit for repeat rounds)
+    future_forecasts = get_forecast_horizon(current_round)
+
+    # Department arrays shared by every panel below - built once per callback
+    beds = get_beds_array(sim_state['bed_capacity'])
+    patients = np.fromiter(
+        (sim_state['current_patients'][dept] for dept in DEPTS),
+        dtype=np.int32, count=len(DEPTS)
     )
-    
-    # 4. Patient Communication Panel
-    communication_components = []
-    
-    for dept, dept_name in DEPT_NAMES.items():
-        patients = simulation_state['current_patients'][dept]
-        staff_count = simulation_state['staff_allocation'][dept]['staff']
-        
-        if staff_count > 0:
-            est_wait = (patients / staff_count) * 15
-        else:
-            est_wait = 0
-        
-        if est_wait > 30:
-            wait_color = '#E74C3C'
-            wait_label = 'Long Wait'
-        elif est_wait > 15:
-            wait_color = '#F39C12'
-            wait_label = 'Moderate Wait'
-        else:
-            wait_color = '#27AE60'
-            wait_label = 'Short Wait'
-        
-        sms_message = ""
-        if est_wait > 20:
-            sms_message = f" SMS: 'Your estimated wait is {est_wait:.0f} min. You may wait in cafe area. We'll text when ready.'"
-        
-        communication_components.append(
-            html.Div([
-                html.Div([
-                    html.Span(f"{dept_name}", style={'fontWeight': 'bold', 'fontSize': '13px'}),
-                    html.Span(f" - {patients} patients", style={'marginLeft': '10px', 'color': '#7F8C8D', 'fontSize': '12px'})
-                ]),
-                html.Div([
-                    html.Span(f" Est. Wait: ", style={'fontSize': '12px'}),
-                    html.Span(f"{est_wait:.0f} min", 
-                             style={'fontSize': '12px', 'fontWeight': 'bold', 'color': wait_color}),
-                    html.Span(f" ({wait_label})", style={'fontSize': '11px', 'color': wait_color, 'marginLeft': '5px'})
-                ]),
-                html.Div([
-                    html.Span(f" {staff_count} staff available", 
-                             style={'fontSize': '11px', 'color': '#34495E'}),
-                ]),
-                html.Div(sms_message, style={'fontSize': '10px', 'color': '#3498DB', 'marginTop': '3px', 'fontStyle': 'italic'}) if sms_message else html.Div()
-            ], style={'padding': '10px', 'marginBottom': '8px', 'backgroundColor': '#F8F9FA',
-                     'borderLeft': f'4px solid {DEPT_COLORS[dept]}', 'borderRadius': '3px'})
-        )
-    
-    patient_communication = html.Div(communication_components)
-    
-    # 5. Resource Table
+    staff = np.fromiter(
+        (sim_state['staff_allocation'][dept]['staff'] for dept in DEPTS),
+        dtype=np.int32, count=len(DEPTS)
+    )
+    total_patients = int(patients.sum())
+
+    # Round info is rendered clientside from er-state-store (see assets/er.js)
+
+    # 2. Heat Map
+    occupied = np.minimum(patients, beds)
+    available = np.maximum(0, beds - occupied)
+    util_vals = np.where(beds > 0, patients / beds * 100, 0.0)
+    est_waits = np.where(staff > 0, patients / np.maximum(staff, 1) * 15, 0.0)
+
+    # Patch only the z-values; the figure shell is static and the
+    # percentages are shown via the hover template
+    heatmap_fig = Patch()
+    heatmap_fig['data'][0]['z'] = [util_vals]
+    
+    # 3. Resource Table - rows assembled from the arrays computed above.
+    # utilization_pct is a data-only field the conditional styles compare
+    # numerically (see STYLE_DATA_COND)
+    bed_util = np.where(beds > 0, occupied / beds * 100, 0.0)
     resource_table_data = []
-    for dept, dept_name in DEPT_NAMES.items():
-        staff_count = simulation_state['staff_allocation'][dept]['staff']
-        patients = simulation_state['current_patients'][dept]
-        total_beds = CAPACITY_CONFIG[dept]['beds']
-        occupied = min(patients, total_beds)
-        available = max(0, total_beds - occupied)
-        utilization_pct = (occupied / total_beds * 100) if total_beds > 0 else 0
-        
-        if utilization_pct >= 80:
-            util_label = f"HIGH ({utilization_pct:.0f}%)"
-        elif utilization_pct >= 60:
-            util_label = f"MODERATE ({utilization_pct:.0f}%)"
-        else:
-            util_label = f"NORMAL ({utilization_pct:.0f}%)"
-        
+    for dept, dept_patients, staff_count, total_beds, occ, avail, util_pct in zip(
+            DEPTS, patients, staff, beds, occupied, available, bed_util):
         resource_table_data.append({
-            'department': dept_name,
-            'current_patients': patients,
-            'staff': staff_count,
-            'total_beds': total_beds,
-            'occupied_beds': occupied,
-            'available_beds': available,
-            'utilization': util_label
+            'department': DEPT_NAMES[dept],
+            'current_patients': int(dept_patients),
+            'staff': int(staff_count),
+            'total_beds': int(total_beds),
+            'occupied_beds': int(occ),
+            'available_beds': int(avail),
+            'utilization': get_utilization_label(int(occ), int(total_beds)),
+            'utilization_pct': float(util_pct)
         })
     
-    # 6. Performance Metrics
-    avg_wait = np.mean(list(simulation_state['wait_times'].values()))
-    total_patients = sum(simulation_state['current_patients'].values())
-    
-    metrics = [
-        {'label': 'Avg Wait Time', 'value': f'{avg_wait:.1f} min', 'icon': ''},
-        {'label': 'Total in System', 'value': total_patients, 'icon': ''},
-        {'label': 'Patients Treated', 'value': simulation_state['total_treated'], 'icon': ''},
-        {'label': 'Current Round', 'value': f'{current_round}/23', 'icon': ''}
-    ]
-    
-    metric_components = []
-    for metric in metrics:
-        metric_components.append(
-            html.Div([
-                html.Div(metric['icon'], style={'fontSize': '30px', 'marginBottom': '5px'}),
-                html.Div(metric['value'], style={'fontSize': '24px', 'fontWeight': 'bold', 
-                                                  'color': '#2C3E50'}),
-                html.Div(metric['label'], style={'fontSize': '12px', 'color': '#7F8C8D'})
-            ], style={'textAlign': 'center', 'padding': '15px', 'backgroundColor': '#F8F9FA',
-                     'borderRadius': '5px', 'width': '22%', 'display': 'inline-block',
-                     'marginRight': '3%'})
-        )
-    
-    performance_metrics = html.Div(metric_components)
-    
-    # 7. Forecast Chart
-    forecast_rounds = list(range(current_round, min(current_round + 4, 24)))
-    forecast_data_by_dept = {dept: [] for dept in DEPT_NAMES.keys()}
-    
-    for round_num in forecast_rounds:
-        if round_num in future_forecasts:
-            for dept in DEPT_NAMES.keys():
-                forecast_data_by_dept[dept].append(
-                    future_forecasts[round_num][dept]['forecast']
-                )
-        else:
-            for dept in DEPT_NAMES.keys():
-                forecast_data_by_dept[dept].append(np.random.poisson(5))
-    
-    forecast_fig = go.Figure()
-    for dept, dept_name in DEPT_NAMES.items():
-        if forecast_data_by_dept[dept]:
-            forecast_fig.add_trace(go.Scatter(
-                x=forecast_rounds[:len(forecast_data_by_dept[dept])],
-                y=forecast_data_by_dept[dept],
-                name=dept_name,
-                mode='lines+markers',
-                line=dict(color=DEPT_COLORS[dept], width=3),
-                marker=dict(size=8)
-            ))
-    
-    forecast_fig.update_layout(
-        xaxis_title="Round",
-        yaxis_title="Expected Patients",
-        height=300,
-        margin=dict(l=40, r=20, t=20, b=40),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        hovermode='x unified'
+    # 4. Communication + performance state, rendered clientside (assets/er.js)
+    avg_wait = np.fromiter(sim_state['wait_times'].values(),
+                           dtype=np.float64, count=len(DEPTS)).mean()
+
+    er_state = {
+        'departments': [
+            {
+                'name': DEPT_NAMES[dept],
+                'color': DEPT_COLORS[dept],
+                'patients': int(patients[i]),
+                'staff': int(staff[i]),
+                'est_wait': float(est_waits[i])
+            }
+            for i, dept in enumerate(DEPTS)
+        ],
+        'metrics': {
+            'avg_wait': float(avg_wait),
+            'total_in_system': total_patients,
+            'treated': sim_state['total_treated'],
+            'round': current_round
+        }
+    }
+
+    # 5. Staffing Recommendations - assembled as one HTML string; each card
+    # used to cost ~10 nested html.Div/html.Span objects to serialize.
+    # The ceil/diff math is batched into single array expressions so only
+    # the string formatting stays in the Python loop
+    round_forecast = future_forecasts.get(current_round, {})
+    expected_arr = np.fromiter(
+        (round_forecast[dept]['forecast'] if dept in round_forecast
+         else sim_state['current_patients'][dept] for dept in DEPTS),
+        dtype=np.float64, count=len(DEPTS)
     )
-    
-    # 8. Staffing Recommendations
+    pps = np.fromiter(
+        (CAPACITY_CONFIG[dept]['patients_per_staff'] for dept in DEPTS),
+        dtype=np.float64, count=len(DEPTS)
+    )
+    staff_rec = np.ceil(expected_arr / pps).astype(np.int64)
+    staff_diffs = staff_rec - staff
+
     rec_components = []
-    for dept, dept_name in DEPT_NAMES.items():
-        current_staff = simulation_state['staff_allocation'][dept]['staff']
-        
-        # Get expected patients from forecast
-        if current_round in future_forecasts and dept in future_forecasts[current_round]:
-            expected_patients = future_forecasts[current_round][dept]['forecast']
-        else:
-            expected_patients = simulation_state['current_patients'][dept]
-        
-        patients_per_staff = CAPACITY_CONFIG[dept]['patients_per_staff']
-        staff_recommended = int(np.ceil(expected_patients / patients_per_staff))
-        staff_diff = staff_recommended - current_staff
-        
+    for (dept, dept_name), expected_patients, current_staff, staff_recommended, staff_diff in zip(
+            DEPT_ITEMS, expected_arr, staff, staff_rec, staff_diffs):
         staff_color = '#27AE60' if staff_diff == 0 else ('#E74C3C' if staff_diff > 0 else '#3498DB')
-        
+
         rec_components.append(
-            html.Div([
-                html.Div(dept_name, style={'fontWeight': 'bold', 'marginBottom': '5px'}),
-                html.Div([
-                    html.Span(f"Expected: {expected_patients:.1f} patients", 
-                             style={'fontSize': '12px', 'color': '#7F8C8D'}),
-                ], style={'marginBottom': '5px'}),
-                html.Div([
-                    html.Span(f"Staff: {current_staff} → {staff_recommended}", 
-                             style={'color': staff_color, 'fontSize': '12px'}),
-                    html.Span(f" ({'+' if staff_diff > 0 else ''}{staff_diff})", 
-                             style={'color': staff_color, 'fontSize': '11px', 'marginLeft': '5px'})
-                ])
-            ], style={'padding': '10px', 'marginBottom': '8px', 'backgroundColor': '#F8F9FA',
-                     'borderRadius': '5px', 'borderLeft': f'4px solid {DEPT_COLORS[dept]}'})
+            f'<div style="padding: 10px; margin-bottom: 8px; background-color: #F8F9FA;'
+            f' border-radius: 5px; border-left: 4px solid {DEPT_COLORS[dept]}">'
+            f'<div style="font-weight: bold; margin-bottom: 5px">{dept_name}</div>'
+            f'<div style="margin-bottom: 5px"><span style="font-size: 12px; color: #7F8C8D">'
+            f'Expected: {expected_patients:.1f} patients</span></div>'
+            f'<div><span style="color: {staff_color}; font-size: 12px">'
+            f'Staff: {current_staff} → {staff_recommended}</span>'
+            f'<span style="color: {staff_color}; font-size: 11px; margin-left: 5px">'
+            f' ({"+" if staff_diff > 0 else ""}{staff_diff})</span></div></div>'
         )
-    
-    staffing_recommendations = html.Div(rec_components)
-    
-    # 9. Historical Trends
+
+    # One Markdown blob instead of ~10 component objects per department
+    staffing_recommendations = dcc.Markdown(''.join(rec_components),
+                                            dangerously_allow_html=True)
+
+    # Only publish the round when it changed so the forecast/historical
+    # callbacks are skipped on pure resource edits
+    round_store = current_round if current_round != stored_round else dash.no_update
+
+    outputs = (heatmap_fig, er_state, resource_table_data,
+               staffing_recommendations, round_store, sim_state,
+               resource_fingerprint(current_round, resource_table_data))
+    if cache_first_load:
+        _initial_outputs = outputs
+    return outputs
+
+
+# Forecast callbacks: pure functions of the current round, so they only
+# fire when round-store changes
+@app.callback(
+    [Output('alerts-store', 'data'),
+     Output('forecast-chart', 'figure')],
+    Input('round-store', 'data')
+)
+def update_forecast_panels(current_round):
+    """Update the surge alerts and forecast chart for the current round"""
+
+    future_forecasts = get_forecast_horizon(current_round)
+
     if CUSTOM_MODULES_AVAILABLE:
         try:
-            hist_summary = historical_data.groupby('round')[list(DEPT_NAMES.keys())].mean().reset_index()
+            alerts = get_cached_surge_alerts(current_round, threshold_percentile=75)
         except:
-            hist_summary = generate_mock_historical()
+            alerts = []
     else:
-        hist_summary = generate_mock_historical()
-    
-    hist_fig = go.Figure()
-    for dept, dept_name in DEPT_NAMES.items():
-        if dept in hist_summary.columns:
-            hist_fig.add_trace(go.Scatter(
-                x=hist_summary['round'],
-                y=hist_summary[dept],
-                name=dept_name,
-                mode='lines',
-                line=dict(color=DEPT_COLORS[dept], width=2),
-                opacity=0.7
-            ))
-    
-    hist_fig.add_vline(x=current_round, line_dash="dash", line_color="red", 
-                       annotation_text="Current Round")
-    
-    hist_fig.update_layout(
-        xaxis_title="Round",
-        yaxis_title="Average Patients",
-        height=300,
-        margin=dict(l=40, r=20, t=20, b=40),
-        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        hovermode='x unified'
-    )
-    
-    return (round_info, alert_panel, heatmap_fig, patient_communication, resource_table_data, 
-            performance_metrics, forecast_fig, staffing_recommendations, hist_fig)
+        alerts = []
+
+    # Alerts go out as plain dicts; assets/er.js renders the panel
+    alert_data = [
+        {'severity': alert.get('severity'), 'message': alert.get('message', 'Alert detected')}
+        for alert in alerts
+    ]
+
+    # Forecast Chart - fill a preallocated (dept, round) array in one pass
+    # instead of growing five Python lists
+    forecast_rounds = np.arange(current_round, min(current_round + 4, 24))
+    forecast_arr = np.empty((len(DEPTS), len(forecast_rounds)), dtype=np.float32)
+
+    for j, round_num in enumerate(forecast_rounds):
+        round_forecasts = future_forecasts.get(int(round_num))
+        if round_forecasts is None:
+            forecast_arr[:, j] = np.random.poisson(5, size=len(DEPTS))
+            continue
+        for i, dept in enumerate(DEPTS):
+            forecast_arr[i, j] = round_forecasts[dept]['forecast']
+
+    # Patch the per-department x/y arrays; trace order matches DEPT_NAMES
+    forecast_fig = Patch()
+    for i in range(len(DEPTS)):
+        forecast_fig['data'][i]['x'] = forecast_rounds
+        forecast_fig['data'][i]['y'] = forecast_arr[i]
+
+    return alert_data, forecast_fig
 
 
-# Callback for save status message
 @app.callback(
+    Output('historical-trends', 'figure'),
+    Input('round-store', 'data'),
+    prevent_initial_call=True
+)
+def update_historical_marker(current_round):
+    """Move the current-round marker; the traces themselves are static"""
+    hist_fig = Patch()
+    hist_fig['layout']['shapes'][0]['x0'] = current_round
+    hist_fig['layout']['shapes'][0]['x1'] = current_round
+    hist_fig['layout']['annotations'][0]['x'] = current_round
+    return hist_fig
+
+
+# Presentation panels are assembled in the browser from the compact state
+# blobs (see assets/er.js) - no Python round-trip for pure formatting work
+app.clientside_callback(
+    ClientsideFunction(namespace='er', function_name='renderStatusPanels'),
+    [Output('patient-communication', 'children'),
+     Output('performance-metrics', 'children')],
+    Input('er-state-store', 'data')
+)
+
+app.clientside_callback(
+    ClientsideFunction(namespace='er', function_name='renderAlerts'),
+    Output('alert-panel', 'children'),
+    Input('alerts-store', 'data')
+)
+
+
+# Round info and save confirmation are pure text formatting - no reason to
+# round-trip to the server for them
+app.clientside_callback(
+    ClientsideFunction(namespace='er', function_name='renderRoundInfo'),
+    Output('round-info', 'children'),
+    Input('er-state-store', 'data')
+)
+
+app.clientside_callback(
+    "function(n){return n > 0 ? '\\u2713 Resources updated successfully!' : '';}",
     Output('save-status', 'children'),
-    [Input('save-resources-btn', 'n_clicks')],
+    Input('save-resources-btn', 'n_clicks'),
     prevent_initial_call=True
 )
-def save_resources(n_clicks):
-    """Display save confirmation message"""
-    if n_clicks > 0:
-        return "✓ Resources updated successfully!"
-    return ""
+
+
+# WSGI entry point. Session state lives in dcc.Store, so multi-worker
+# deployments are safe:
+#   gunicorn -w 4 --threads 2 dashboard:server
+server = app.server
 
 
 if __name__ == '__main__':
@@ -683,4 +968,7 @@ if __name__ == '__main__':
     print("\nPress Ctrl+C to stop the server")
     print("="*60 + "\n")
     
-    app.run(debug=True, host='127.0.0.1', port=8050)
\ No newline at end of file
+    # Dev server without the debug reloader (which imports the module - and
+    # regenerates the historical data - twice). For production use gunicorn
+    # against dashboard:server as noted above.
+    app.run(debug=False, host='127.0.0.1', port=8050)
\ No newline at end of file
@@ -9,8 +9,17 @@ from datetime import datetime, timedelta
 
 class ERDataGenerator:
     """Generate realistic ER patient arrival data based on gameplay patterns"""
-    
-    def __init__(self):
+
+    # Department processing order shared by the vectorized paths, mirroring
+    # the list on ERPredictiveAnalytics
+    DEPARTMENTS = ('emergency_walkin', 'emergency_ambulance', 'surgery',
+                   'critical_care', 'step_down')
+    DEPT_INDEX = {dept: i for i, dept in enumerate(DEPARTMENTS)}
+
+    def __init__(self, seed=None):
+        # Lock-free PCG64 generator; seedable for reproducible sessions
+        self._rng = np.random.default_rng(seed)
+
         # Actual gameplay data (23 rounds)
         self.actual_data = {
             'emergency_walkin': [2,4,3,8,4,5,5,7,5,4,4,5,6,4,6,2,2,1,7,1,7,4,2],
@@ -22,7 +31,43 @@ class ERDataGenerator:
         
         # Calculate statistics from actual data
         self.stats = self._calculate_stats()
-    
+
+        # (rounds, depts) view of the actual session in DEPARTMENTS order,
+        # converted from the lists once so session 0 is a plain array write
+        self._actual_matrix = np.array(
+            [self.actual_data[dept] for dept in self.DEPARTMENTS],
+            dtype=np.int8).T
+
+        # Array views of the stats used by the vectorized session generator,
+        # indexed [phase, dept] / [dept] in DEPARTMENTS order
+        self._phase_means = np.array([
+            [self.stats[dept][key] for dept in self.DEPARTMENTS]
+            for key in ('early_mean', 'mid_mean', 'late_mean')
+        ])
+        self._stds = np.array([self.stats[dept]['std'] for dept in self.DEPARTMENTS])
+        self._max_caps = np.array([self.stats[dept]['max'] for dept in self.DEPARTMENTS],
+                                  dtype=np.int64)
+
+        # Scalar-path parameter tuples, cached per variation level
+        self._session_params_cache = {}
+
+    def _session_params(self, variation):
+        """Per-department (means-by-phase, scaled std, cap) tuples.
+
+        The variation scaling and cap lookups are constant for a session, so
+        generate_round_arrivals reads them from here instead of recomputing
+        per (round, dept) call.
+        """
+        params = self._session_params_cache.get(variation)
+        if params is None:
+            params = {
+                dept: (stat['early_mean'], stat['mid_mean'], stat['late_mean'],
+                       stat['std'] * (1 + variation), stat['max'] + 2)
+                for dept, stat in self.stats.items()
+            }
+            self._session_params_cache[variation] = params
+        return params
+
     def _calculate_stats(self):
         """Calculate statistical properties of actual gameplay data"""
         stats = {}
@@ -47,71 +92,109 @@ class ERDataGenerator:
             round_num: Round number (0-22)
             variation_factor: How much to vary from base patterns (0-1)
         """
-        stat = self.stats[dept]
-        
+        early_mean, mid_mean, late_mean, std_dev, cap = self._session_params(variation_factor)[dept]
+
         # Determine base rate based on round position
         if round_num < 8:
-            base_mean = stat['early_mean']
+            base_mean = early_mean
         elif round_num < 16:
-            base_mean = stat['mid_mean']
+            base_mean = mid_mean
         else:
-            base_mean = stat['late_mean']
-        
-        # Add variation
-        std_dev = stat['std'] * (1 + variation_factor)
-        
+            base_mean = late_mean
+
         # Generate value (ensure non-negative integer)
-        value = max(0, int(np.random.normal(base_mean, std_dev)))
-        
+        value = max(0, int(self._rng.normal(base_mean, std_dev)))
+
         # Apply department-specific constraints
         if dept in ['surgery', 'critical_care']:
             # These departments rare after round 8
             if round_num > 8:
-                value = np.random.poisson(0.1)  # Very rare
-        
+                value = self._rng.poisson(0.1)  # Very rare
+
         if dept == 'step_down':
             # Front-loaded with occasional late arrivals
             if round_num > 10 and round_num < 18:
-                value = 0 if np.random.random() > 0.1 else value
-        
-        return min(value, stat['max'] + 2)  # Cap at reasonable max
+                value = 0 if self._rng.random() > 0.1 else value
+
+        return min(value, cap)  # Cap at reasonable max
     
+    def _generate_session_values(self, num_rounds, variation):
+        """Arrival counts for one generated session as a (rounds, depts) array
+
+        Vectorized equivalent of calling generate_round_arrivals for every
+        (round, dept) pair: one batched normal draw for the whole session,
+        then the department-specific constraints applied as masks.
+        """
+        rounds = np.arange(num_rounds)
+        phase = np.where(rounds < 8, 0, np.where(rounds < 16, 1, 2))
+
+        # (num_rounds, depts) draw with per-phase means and scaled stds
+        means = self._phase_means[phase]
+        std_devs = self._stds * (1 + variation)
+        values = self._rng.normal(means, std_devs, size=(num_rounds, len(self.DEPARTMENTS)))
+        values = np.maximum(values.astype(np.int64), 0)
+
+        # Surgery/critical care are very rare after round 8
+        rare_mask = rounds > 8
+        for dept in ('surgery', 'critical_care'):
+            col = self.DEPT_INDEX[dept]
+            values[rare_mask, col] = self._rng.poisson(0.1, size=int(rare_mask.sum()))
+
+        # Step down is front-loaded with occasional late arrivals
+        step_col = self.DEPT_INDEX['step_down']
+        late_mask = (rounds > 10) & (rounds < 18)
+        suppressed = late_mask & (self._rng.random(num_rounds) > 0.1)
+        values[suppressed, step_col] = 0
+
+        # Cap at reasonable max per department. The capped counts are tiny
+        # (single digits), so int8 columns cut the session memory footprint
+        # to an eighth of the default int64
+        return np.minimum(values, self._max_caps + 2).astype(np.int8)
+
     def generate_session(self, num_rounds=23, session_id=1, variation=0.2):
         """Generate a complete gameplay session"""
+        values = self._generate_session_values(num_rounds, variation)
+
         session_data = {
-            'round': list(range(1, num_rounds + 1)),
-            'session_id': [session_id] * num_rounds,
-            'emergency_walkin': [],
-            'emergency_ambulance': [],
-            'surgery': [],
-            'critical_care': [],
-            'step_down': []
+            'round': np.arange(1, num_rounds + 1, dtype=np.int16),
+            'session_id': np.full(num_rounds, session_id, dtype=np.int16)
         }
-        
-        for round_num in range(num_rounds):
-            for dept in ['emergency_walkin', 'emergency_ambulance', 'surgery', 'critical_care', 'step_down']:
-                arrivals = self.generate_round_arrivals(dept, round_num, variation)
-                session_data[dept].append(arrivals)
-        
+        for col, dept in enumerate(self.DEPARTMENTS):
+            session_data[dept] = values[:, col]
+
         return pd.DataFrame(session_data)
-    
+
     def generate_multiple_sessions(self, num_sessions=5, num_rounds=23):
         """Generate multiple gameplay sessions with varying patterns"""
-        all_sessions = []
-        
+        # Preallocated column arrays filled slice-by-slice, handed to the
+        # DataFrame constructor with copy=False - no per-session frames, no
+        # concat, and no block-consolidation copy of a 2D matrix
+        actual_rounds = len(self._actual_matrix)
+        total_rows = actual_rounds + (num_sessions - 1) * num_rounds
+        round_col = np.empty(total_rows, dtype=np.int16)
+        session_col = np.empty(total_rows, dtype=np.int16)
+        dept_cols = {dept: np.empty(total_rows, dtype=np.int8)
+                     for dept in self.DEPARTMENTS}
+
         # First session is actual data
-        actual_df = pd.DataFrame(self.actual_data)
-        actual_df.insert(0, 'round', list(range(1, len(actual_df) + 1)))
-        actual_df.insert(1, 'session_id', 0)
-        all_sessions.append(actual_df)
-        
+        round_col[:actual_rounds] = np.arange(1, actual_rounds + 1)
+        session_col[:actual_rounds] = 0
+        for col, dept in enumerate(self.DEPARTMENTS):
+            dept_cols[dept][:actual_rounds] = self._actual_matrix[:, col]
+
         # Generate additional sessions with varying intensities
+        row = actual_rounds
         for session_id in range(1, num_sessions):
             variation = 0.15 + (session_id * 0.05)  # Increasing variation
-            session_df = self.generate_session(num_rounds, session_id, variation)
-            all_sessions.append(session_df)
-        
-        return pd.concat(all_sessions, ignore_index=True)
+            values = self._generate_session_values(num_rounds, variation)
+            round_col[row:row + num_rounds] = np.arange(1, num_rounds + 1)
+            session_col[row:row + num_rounds] = session_id
+            for col, dept in enumerate(self.DEPARTMENTS):
+                dept_cols[dept][row:row + num_rounds] = values[:, col]
+            row += num_rounds
+
+        return pd.DataFrame({'round': round_col, 'session_id': session_col, **dept_cols},
+                            copy=False)
     
     def generate_real_time_data(self, current_round, historical_df):
         """
@@ -125,11 +208,11 @@ class ERDataGenerator:
         round_data = historical_df[historical_df['round'] == current_round]
         
         current_data = {}
-        for dept in ['emergency_walkin', 'emergency_ambulance', 'surgery', 'critical_care', 'step_down']:
+        for dept in self.DEPARTMENTS:
             if len(round_data) > 0:
                 mean_val = round_data[dept].mean()
                 std_val = round_data[dept].std() if round_data[dept].std() > 0 else 1
-                current_data[dept] = max(0, int(np.random.normal(mean_val, std_val)))
+                current_data[dept] = max(0, int(self._rng.normal(mean_val, std_val)))
             else:
                 # Fallback to overall stats
                 current_data[dept] = self.generate_round_arrivals(dept, current_round - 1)
@@ -3,9 +3,44 @@ Healthcare ER Patient Flow - Predictive Analytics
 Forecasting models for patient arrivals and bottleneck detection
 """
 
+import math
+from collections import namedtuple
+
 import numpy as np
 import pandas as pd
-from scipy import stats
+
+# Uniform result shape for the component forecast methods. Point estimates
+# (moving average, trend) carry NaN bounds; attribute access replaces the
+# isinstance(dict) branching the ensemble used to do.
+ForecastResult = namedtuple('ForecastResult',
+                            ['forecast', 'lower_bound', 'upper_bound', 'confidence'])
+
+
+def _point_forecast(value):
+    """ForecastResult for methods that only produce a point estimate"""
+    return ForecastResult(value, math.nan, math.nan, 0.0)
+
+
+def _linfit(x, y):
+    """Closed-form least-squares slope and intercept.
+
+    The trend window is at most a handful of points, where plain Python
+    arithmetic beats the setup cost of scipy.stats.linregress (which also
+    computes r/p/std_err we never used).
+    """
+    n = len(x)
+    sx = sy = sxx = sxy = 0.0
+    for xi, yi in zip(x, y):
+        sx += xi
+        sy += yi
+        sxx += xi * xi
+        sxy += xi * yi
+    denom = n * sxx - sx * sx
+    if denom == 0:
+        return 0.0, sy / n
+    slope = (n * sxy - sx * sy) / denom
+    return slope, (sy - slope * sx) / n
+
 
 class ERPredictiveAnalytics:
     """Predictive analytics for ER patient flow"""
@@ -20,8 +55,66 @@ class ERPredictiveAnalytics:
         """
         self.historical_data = historical_data
         self.departments = ['emergency_walkin', 'emergency_ambulance', 'surgery', 'critical_care', 'step_down']
+        self._dept_index = {dept: i for i, dept in enumerate(self.departments)}
         self.forecast_cache = {}
-    
+
+        # Historical data is fixed for the life of the object, so the
+        # per-round aggregates every forecast method reads are computed once
+        # here instead of re-filtering the full table per call
+        by_round = historical_data.groupby('round')[self.departments]
+        self._round_mean = by_round.mean()
+        self._round_std = by_round.std()
+        self._global_mean = historical_data[self.departments].mean()
+        self._global_std = historical_data[self.departments].std()
+
+        # Prefix sums over the per-round mean table. Window means and the
+        # least-squares sums in the batched horizon forecast become O(1)
+        # subtractions instead of per-round slices. They index positions by
+        # round number, which is only valid when the rounds are exactly
+        # 1..R with no gaps; other inputs use the label-based paths
+        idx = self._round_mean.index.to_numpy(dtype=np.float64)
+        means = self._round_mean.to_numpy()
+        self._num_rounds = len(idx)
+        self._rounds_contiguous = np.array_equal(idx, np.arange(1, len(idx) + 1))
+        self._cum_y = np.vstack([np.zeros(means.shape[1]), np.cumsum(means, axis=0)])
+        self._cum_x = np.concatenate([[0.0], np.cumsum(idx)])
+        self._cum_xx = np.concatenate([[0.0], np.cumsum(idx * idx)])
+        self._cum_xy = np.vstack([np.zeros(means.shape[1]),
+                                  np.cumsum(idx[:, None] * means, axis=0)])
+
+        # Precomputed three-round moving averages of the per-round means:
+        # zero-copy overlapping windows reduced in one pass, so the default
+        # moving_average_forecast is a scalar lookup. Needs at least one
+        # full window (sliding_window_view rejects shorter input) and the
+        # contiguous round numbering above
+        if self._rounds_contiguous and len(means) >= 3:
+            self._ma3 = np.lib.stride_tricks.sliding_window_view(
+                means, 3, axis=0).mean(axis=-1)
+        else:
+            self._ma3 = None
+
+        # Percentile thresholds for surge detection, filled lazily per
+        # requested percentile (75/90 in practice)
+        self._percentile_cache = {}
+
+        # Contiguous (rows, depts) matrix for batched reductions, plus SoA
+        # column views so reducers index raw ndarrays instead of going
+        # through pandas Series dispatch per call. float32 carries the small
+        # counts exactly while halving the percentile/mean bandwidth
+        self._dept_matrix = historical_data[self.departments].to_numpy(dtype=np.float32)
+        self._cols = {dept: self._dept_matrix[:, i]
+                      for i, dept in enumerate(self.departments)}
+        self._summary = None
+
+    def _percentile_thresholds(self, percentile):
+        """Per-department historical percentiles, computed once per level"""
+        if percentile not in self._percentile_cache:
+            self._percentile_cache[percentile] = {
+                dept: np.percentile(self._cols[dept], percentile)
+                for dept in self.departments
+            }
+        return self._percentile_cache[percentile]
+
     def moving_average_forecast(self, dept, current_round, window=3):
         """
         Simple moving average forecast
@@ -33,18 +126,24 @@ class ERPredictiveAnalytics:
         """
         if current_round <= 1:
             # Use historical average for first round
-            return self.historical_data[dept].mean()
-        
-        # Get data from recent rounds across all sessions
-        recent_data = self.historical_data[
-            (self.historical_data['round'] >= max(1, current_round - window)) & 
-            (self.historical_data['round'] < current_round)
-        ][dept]
-        
+            return _point_forecast(self._global_mean[dept])
+
+        # Full default-width windows read straight off the precomputed
+        # moving-average curve; partial windows at the edges, other window
+        # sizes and histories without the curve fall through to slicing
+        # the per-round means
+        if (self._ma3 is not None and window == 3
+                and 4 <= current_round <= self._num_rounds + 1):
+            return _point_forecast(
+                self._ma3[current_round - 4, self._dept_index[dept]])
+
+        # Average of the cached per-round means in the window
+        recent_data = self._round_mean.loc[max(1, current_round - window):current_round - 1, dept]
+
         if len(recent_data) == 0:
-            return self.historical_data[dept].mean()
-        
-        return recent_data.mean()
+            return _point_forecast(self._global_mean[dept])
+
+        return _point_forecast(recent_data.mean())
     
     def time_based_forecast(self, dept, current_round):
         """
@@ -54,22 +153,22 @@ class ERPredictiveAnalytics:
             dept: Department name
             current_round: Current round number
         """
-        # Get all historical data for this specific round
-        round_data = self.historical_data[self.historical_data['round'] == current_round][dept]
-        
-        if len(round_data) == 0:
-            return self.historical_data[dept].mean()
-        
-        # Return mean with confidence interval
-        mean_forecast = round_data.mean()
-        std_forecast = round_data.std() if len(round_data) > 1 else round_data.mean() * 0.3
-        
-        return {
-            'forecast': mean_forecast,
-            'lower_bound': max(0, mean_forecast - std_forecast),
-            'upper_bound': mean_forecast + std_forecast,
-            'confidence': 0.68  # ~68% confidence (1 std dev)
-        }
+        # O(1) lookups on the cached per-round aggregates
+        if current_round not in self._round_mean.index:
+            return _point_forecast(self._global_mean[dept])
+
+        mean_forecast = self._round_mean.at[current_round, dept]
+        std_forecast = self._round_std.at[current_round, dept]
+        if pd.isna(std_forecast):
+            # Single observation for this round
+            std_forecast = mean_forecast * 0.3
+
+        return ForecastResult(
+            forecast=mean_forecast,
+            lower_bound=max(0, mean_forecast - std_forecast),
+            upper_bound=mean_forecast + std_forecast,
+            confidence=0.68  # ~68% confidence (1 std dev)
+        )
     
     def trend_forecast(self, dept, current_round, lookback=5):
         """
@@ -83,25 +182,22 @@ class ERPredictiveAnalytics:
         if current_round <= 2:
             return self.moving_average_forecast(dept, current_round)
         
-        # Get recent rounds data
-        recent_rounds = self.historical_data[
-            (self.historical_data['round'] >= max(1, current_round - lookback)) & 
-            (self.historical_data['round'] < current_round)
-        ].groupby('round')[dept].mean().reset_index()
-        
+        # Per-round means for the lookback window, straight from the cache
+        recent_rounds = self._round_mean.loc[max(1, current_round - lookback):current_round - 1, dept]
+
         if len(recent_rounds) < 2:
             return self.moving_average_forecast(dept, current_round)
-        
+
         # Simple linear regression
-        x = recent_rounds['round'].values
-        y = recent_rounds[dept].values
-        
-        slope, intercept, r_value, p_value, std_err = stats.linregress(x, y)
-        
+        x = recent_rounds.index.to_numpy()
+        y = recent_rounds.to_numpy()
+
+        slope, intercept = _linfit(x, y)
+
         # Forecast for current round
         forecast = slope * current_round + intercept
-        
-        return max(0, forecast)
+
+        return _point_forecast(max(0, forecast))
     
     def ensemble_forecast(self, dept, current_round):
         """
@@ -111,27 +207,35 @@ class ERPredictiveAnalytics:
             dept: Department name
             current_round: Current round number
         """
-        # Get forecasts from different methods
-        ma_forecast = self.moving_average_forecast(dept, current_round, window=3)
+        # Pure function of (dept, round) for fixed historical data, so
+        # repeat calls come straight from the cache
+        cache_key = (dept, current_round)
+        cached = self.forecast_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Get forecasts from different methods - all ForecastResult tuples,
+        # so no isinstance branching on the shapes
+        ma_forecast = self.moving_average_forecast(dept, current_round, window=3).forecast
         time_forecast = self.time_based_forecast(dept, current_round)
-        trend_forecast = self.trend_forecast(dept, current_round, lookback=5)
-        
-        # Extract forecast value if dict
-        time_value = time_forecast['forecast'] if isinstance(time_forecast, dict) else time_forecast
-        
+        trend_forecast = self.trend_forecast(dept, current_round, lookback=5).forecast
+
+        time_value = time_forecast.forecast
+
         # Weighted average (time-based gets more weight as it's most relevant)
         forecast = (0.4 * time_value + 0.3 * ma_forecast + 0.3 * trend_forecast)
-        
-        # Calculate confidence bounds
-        if isinstance(time_forecast, dict):
-            lower = time_forecast['lower_bound']
-            upper = time_forecast['upper_bound']
-        else:
-            std = self.historical_data[dept].std()
+
+        # Confidence bounds: NaN bounds mark a point-estimate fallback, in
+        # which case the global std supplies the interval
+        if math.isnan(time_forecast.lower_bound):
+            std = self._global_std[dept]
             lower = max(0, forecast - std)
             upper = forecast + std
-        
-        return {
+        else:
+            lower = time_forecast.lower_bound
+            upper = time_forecast.upper_bound
+
+        result = {
             'forecast': round(forecast, 1),
             'lower_bound': round(lower, 1),
             'upper_bound': round(upper, 1),
@@ -141,13 +245,114 @@ class ERPredictiveAnalytics:
                 'trend': round(trend_forecast, 1)
             }
         }
+        self.forecast_cache[cache_key] = result
+        return result
     
+    def _ensemble_forecast_all(self, current_round):
+        """Batched ensemble across every department for a single round"""
+        return self._ensemble_forecast_horizon(current_round, 1)[current_round]
+
+    def _ensemble_forecast_horizon(self, current_round, n):
+        """Batched ensemble for every (round, department) pair in a horizon.
+
+        Mirrors ensemble_forecast exactly, but computes all n rounds in one
+        (n, depts) pass: the window means come from the prefix-sum tables
+        and the trend fits are a single broadcast normal-equations solve,
+        instead of re-running the three methods per round and department.
+        """
+        # The prefix tables index positions by round number; for histories
+        # whose rounds are not a contiguous 1..R range, delegate to the
+        # label-based per-department path instead of mis-slicing
+        if not self._rounds_contiguous:
+            return {
+                future_round: {dept: self.ensemble_forecast(dept, future_round)
+                               for dept in self.departments}
+                for future_round in range(current_round, current_round + n)
+            }
+
+        rounds = np.arange(current_round, current_round + n)
+        last = self._num_rounds
+        global_mean = self._global_mean.to_numpy()
+
+        # Time-based component (per-round mean/std rows, global fallback)
+        known = (rounds >= 1) & (rounds <= last)
+        time_values = np.where(known[:, None],
+                               self._round_mean.reindex(rounds).to_numpy(),
+                               global_mean)
+        time_stds = self._round_std.reindex(rounds).to_numpy()
+        time_stds = np.where(np.isnan(time_stds), time_values * 0.3, time_stds)
+        lower = np.maximum(0, time_values - time_stds)
+        upper = time_values + time_stds
+
+        # Window sums over the per-round means: rounds [a, b] inclusive,
+        # clipped to the historical range, via prefix-sum differences
+        hi = np.clip(rounds - 1, 0, last)
+        lo3 = np.clip(np.maximum(1, rounds - 3) - 1, 0, last)
+        lo5 = np.clip(np.maximum(1, rounds - 5) - 1, 0, last)
+
+        # Moving-average component (window 3 of per-round means)
+        counts3 = np.maximum(0, hi - lo3)
+        ma_values = np.where(
+            ((rounds > 1) & (counts3 > 0))[:, None],
+            (self._cum_y[hi] - self._cum_y[lo3]) / np.maximum(counts3, 1)[:, None],
+            global_mean)
+
+        # Trend component: same normal-equations form as _linfit, with the
+        # per-window sums batched across all rounds and columns at once
+        counts5 = np.maximum(0, hi - lo5)
+        nw = counts5[:, None].astype(np.float64)
+        sx = (self._cum_x[hi] - self._cum_x[lo5])[:, None]
+        sxx = (self._cum_xx[hi] - self._cum_xx[lo5])[:, None]
+        sy = self._cum_y[hi] - self._cum_y[lo5]
+        sxy = self._cum_xy[hi] - self._cum_xy[lo5]
+        denom = nw * sxx - sx * sx
+        slopes = (nw * sxy - sx * sy) / np.where(denom == 0, 1, denom)
+        intercepts = (sy - slopes * sx) / np.maximum(nw, 1)
+        trend_values = np.where(
+            ((rounds > 2) & (counts5 >= 2))[:, None],
+            np.maximum(0, slopes * rounds[:, None] + intercepts),
+            ma_values)
+
+        forecast = 0.4 * time_values + 0.3 * ma_values + 0.3 * trend_values
+
+        # Rounds outside the historical range fall back to global-std bounds
+        if not known.all():
+            global_std = self._global_std.to_numpy()
+            unknown = ~known[:, None]
+            lower = np.where(unknown, np.maximum(0, forecast - global_std), lower)
+            upper = np.where(unknown, forecast + global_std, upper)
+
+        return {
+            int(round_num): {
+                dept: {
+                    'forecast': round(float(forecast[j, i]), 1),
+                    'lower_bound': round(float(lower[j, i]), 1),
+                    'upper_bound': round(float(upper[j, i]), 1),
+                    'methods': {
+                        'moving_average': round(float(ma_values[j, i]), 1),
+                        'time_based': round(float(time_values[j, i]), 1),
+                        'trend': round(float(trend_values[j, i]), 1)
+                    }
+                }
+                for i, dept in enumerate(self.departments)
+            }
+            for j, round_num in enumerate(rounds)
+        }
+
     def forecast_all_departments(self, current_round):
         """Generate forecasts for all departments"""
-        forecasts = {}
-        for dept in self.departments:
-            forecasts[dept] = self.ensemble_forecast(dept, current_round)
-        
+        forecasts = {
+            dept: self.forecast_cache[(dept, current_round)]
+            for dept in self.departments
+            if (dept, current_round) in self.forecast_cache
+        }
+        if len(forecasts) == len(self.departments):
+            return forecasts
+
+        forecasts = self._ensemble_forecast_all(current_round)
+        for dept, result in forecasts.items():
+            self.forecast_cache[(dept, current_round)] = result
+
         return forecasts
     
     def forecast_next_n_rounds(self, current_round, n=4):
@@ -158,11 +363,22 @@ class ERPredictiveAnalytics:
             current_round: Current round number
             n: Number of rounds to forecast ahead
         """
-        forecast_horizon = {}
-        
-        for future_round in range(current_round, current_round + n):
-            forecast_horizon[future_round] = self.forecast_all_departments(future_round)
-        
+        # Serve fully-cached horizons without recomputing
+        forecast_horizon = {
+            future_round: {dept: self.forecast_cache[(dept, future_round)]
+                           for dept in self.departments}
+            for future_round in range(current_round, current_round + n)
+            if all((dept, future_round) in self.forecast_cache
+                   for dept in self.departments)
+        }
+        if len(forecast_horizon) == n:
+            return forecast_horizon
+
+        forecast_horizon = self._ensemble_forecast_horizon(current_round, n)
+        for future_round, forecasts in forecast_horizon.items():
+            for dept, result in forecasts.items():
+                self.forecast_cache[(dept, future_round)] = result
+
         return forecast_horizon
     
     def detect_surge(self, forecast_data, threshold_percentile=75):
@@ -173,26 +389,37 @@ class ERPredictiveAnalytics:
             forecast_data: Forecast dictionary for a round
             threshold_percentile: Percentile to define "high" arrivals
         """
+        # Cached historical percentile thresholds
+        thresholds = self._percentile_thresholds(threshold_percentile)
+        high_thresholds = self._percentile_thresholds(90)
+
+        # One vectorized comparison across all departments; only the
+        # exceeding ones get an alert dict built
+        depts = list(forecast_data)
+        count = len(depts)
+        forecast_values = np.fromiter(
+            (f['forecast'] if isinstance(f, dict) else f for f in forecast_data.values()),
+            dtype=np.float64, count=count
+        )
+        threshold_arr = np.fromiter((thresholds[d] for d in depts),
+                                    dtype=np.float64, count=count)
+        high_arr = np.fromiter((high_thresholds[d] for d in depts),
+                               dtype=np.float64, count=count)
+
         alerts = []
-        
-        for dept, forecast in forecast_data.items():
-            # Calculate historical percentile thresholds
-            hist_data = self.historical_data[dept]
-            threshold = np.percentile(hist_data, threshold_percentile)
-            
-            forecast_value = forecast['forecast'] if isinstance(forecast, dict) else forecast
-            
-            # Check if forecast exceeds threshold
-            if forecast_value > threshold:
-                severity = 'HIGH' if forecast_value > np.percentile(hist_data, 90) else 'MODERATE'
-                alerts.append({
-                    'department': dept,
-                    'forecast': forecast_value,
-                    'threshold': threshold,
-                    'severity': severity,
-                    'message': f"{dept.replace('_', ' ').title()}: Expected {forecast_value:.1f} patients (threshold: {threshold:.1f})"
-                })
-        
+        for i in np.flatnonzero(forecast_values > threshold_arr):
+            dept = depts[i]
+            forecast_value = float(forecast_values[i])
+            threshold = float(threshold_arr[i])
+            severity = 'HIGH' if forecast_value > high_arr[i] else 'MODERATE'
+            alerts.append({
+                'department': dept,
+                'forecast': forecast_value,
+                'threshold': threshold,
+                'severity': severity,
+                'message': f"{dept.replace('_', ' ').title()}: Expected {forecast_value:.1f} patients (threshold: {threshold:.1f})"
+            })
+
         return alerts
     
     def calculate_capacity_recommendations(self, forecasts, capacity_config):
@@ -212,36 +439,48 @@ class ERPredictiveAnalytics:
             
             config = capacity_config[dept]
             forecast_value = forecast['forecast'] if isinstance(forecast, dict) else forecast
-            
-            # Calculate needed staff
-            nurses_needed = np.ceil(forecast_value / config.get('patients_per_nurse', 4))
-            doctors_needed = np.ceil(forecast_value / config.get('patients_per_doctor', 6))
-            
+
+            # Calculate needed staff - math.ceil on the already-Python floats
+            # avoids a numpy scalar ufunc round-trip per department
+            nurses_needed = math.ceil(forecast_value / config.get('patients_per_nurse', 4))
+            doctors_needed = math.ceil(forecast_value / config.get('patients_per_doctor', 6))
+
             recommendations[dept] = {
                 'expected_patients': forecast_value,
-                'nurses_recommended': int(nurses_needed),
-                'doctors_recommended': int(doctors_needed)
+                'nurses_recommended': nurses_needed,
+                'doctors_recommended': doctors_needed
             }
         
         return recommendations
     
     def get_summary_statistics(self):
         """Get summary statistics of historical data"""
+        if self._summary is not None:
+            return self._summary
+
+        # One batched pass per statistic across all departments, then a
+        # single loop to assemble the per-department dicts
+        matrix = self._dept_matrix
+        percentiles = np.percentile(matrix, [25, 50, 75, 90], axis=0)
+        means = matrix.mean(axis=0)
+        stds = matrix.std(axis=0, ddof=1)
+        mins = matrix.min(axis=0)
+        maxs = matrix.max(axis=0)
+
         summary = {}
-        
-        for dept in self.departments:
-            dept_data = self.historical_data[dept]
+        for i, dept in enumerate(self.departments):
             summary[dept] = {
-                'mean': dept_data.mean(),
-                'median': dept_data.median(),
-                'std': dept_data.std(),
-                'min': dept_data.min(),
-                'max': dept_data.max(),
-                'p25': np.percentile(dept_data, 25),
-                'p75': np.percentile(dept_data, 75),
-                'p90': np.percentile(dept_data, 90)
+                'mean': means[i],
+                'median': percentiles[1, i],
+                'std': stds[i],
+                'min': mins[i],
+                'max': maxs[i],
+                'p25': percentiles[0, i],
+                'p75': percentiles[2, i],
+                'p90': percentiles[3, i]
             }
-        
+
+        self._summary = summary
         return summary
 
 